@@ -31,8 +31,33 @@ class TaskUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         )
         self.api = api
         self._task_list_id = task_list_id
+        self._data_by_id: dict[str, dict[str, Any]] = {}
+
+    @property
+    def data_by_id(self) -> dict[str, dict[str, Any]]:
+        """Return all tasks from the last update, including subtasks, by id."""
+        return self._data_by_id
 
     async def _async_update_data(self) -> list[dict[str, Any]]:
         """Fetch tasks from API endpoint."""
         async with asyncio.timeout(TIMEOUT):
-            return await self.api.list_tasks(self._task_list_id)
+            tasks = await self.api.list_tasks(self._task_list_id)
+        for task in tasks:
+            # due API field is a timestamp string, but with only date resolution
+            if (due := task.get("due")) is not None:
+                task["_due_date"] = datetime.date.fromisoformat(due[:10])
+        self._data_by_id = {task["id"]: task for task in tasks}
+        return _order_tasks(tasks)
+
+
+def _order_tasks(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order the task items response.
+
+    All tasks have an order amongst their sibblings based on position.
+
+        Home Assistant To-do items do not support the Google Task parent/sibbling
+    relationships and the desired behavior is for them to be filtered.
+    """
+    parents = [task for task in tasks if task.get("parent") is None]
+    parents.sort(key=lambda task: task["position"])
+    return parents
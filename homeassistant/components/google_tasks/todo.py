@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+import asyncio
+from datetime import date, datetime, time, timedelta, tzinfo
+from functools import lru_cache, partial
 import logging
 from typing import Any, cast
 
-from dateutil.parser import isoparse
-
 from homeassistant.components.todo import (
     TodoItem,
     TodoItemStatus,
@@ -15,7 +15,7 @@ from homeassistant.components.todo import (
     TodoListEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceResponse, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
@@ -32,42 +32,74 @@ TODO_STATUS_MAP = {
     "completed": TodoItemStatus.COMPLETED,
 }
 TODO_STATUS_MAP_INV = {v: k for k, v in TODO_STATUS_MAP.items()}
+_STATUS_GET = TODO_STATUS_MAP.get
+
+# Category, summary header and input_text helper for each stored task summary
+EMAIL_SUMMARIES = (
+    ("Today", "This is the list of tasks due today:\n", "input_text.stored_task_data"),
+    (
+        "This Week",
+        "This is the list of tasks due this week:\n",
+        "input_text.stored_weekly_task_data",
+    ),
+    (
+        "Upcoming",
+        "This is the list of upcoming tasks in future weeks:\n",
+        "input_text.stored_upcoming_task_data",
+    ),
+    (
+        "Overdue",
+        "This is the list of overdue tasks which need your action:\n",
+        "input_text.stored_overdue_task_data",
+    ),
+)
+
+
+def _iso_start_of_local_day(due: date) -> str:
+    """Return the start of the local day of a due date as a timestamp string."""
+    if isinstance(due, datetime):
+        due = due.date()
+    return _cached_start_of_day(due, dt_util.get_default_time_zone())
+
+
+@lru_cache(maxsize=512)
+def _cached_start_of_day(due: date, time_zone: tzinfo) -> str:
+    """Return the start of day in the time zone, cached per date and zone."""
+    return datetime.combine(due, time(), tzinfo=time_zone).isoformat()
 
 
 def _convert_todo_item(item: TodoItem) -> dict[str, str | None]:
     """Convert TodoItem dataclass items to dictionary of attributes the tasks API."""
-    result: dict[str, str | None] = {}
-    result["title"] = item.summary
-    if item.status is not None:
-        result["status"] = TODO_STATUS_MAP_INV[item.status]
-    else:
-        result["status"] = TodoItemStatus.NEEDS_ACTION
-    if (due := item.due) is not None:
+    return {
+        "title": item.summary,
+        "status": (
+            TODO_STATUS_MAP_INV[item.status]
+            if item.status is not None
+            else TodoItemStatus.NEEDS_ACTION
+        ),
         # due API field is a timestamp string, but with only date resolution
-        result["due"] = dt_util.start_of_local_day(due).isoformat()
-    else:
-        result["due"] = None
-    result["notes"] = item.description
-    return result
+        "due": _iso_start_of_local_day(item.due) if item.due is not None else None,
+        "notes": item.description,
+    }
 
 
-def _convert_api_item(item: dict[str, str]) -> TodoItem:
+def _convert_api_item(item: dict[str, Any]) -> TodoItem:
     """Convert tasks API items into a TodoItem."""
-    due: date | None = None
-    if (due_str := item.get("due")) is not None:
-        due = datetime.fromisoformat(due_str).date()
     return TodoItem(
         summary=item["title"],
         uid=item["id"],
-        status=TODO_STATUS_MAP.get(
-            item.get("status", ""),
-            TodoItemStatus.NEEDS_ACTION,
-        ),
-        due=due,
+        status=_STATUS_GET(item.get("status"), TodoItemStatus.NEEDS_ACTION),
+        due=item.get("_due_date"),
         description=item.get("notes"),
     )
 
 
+def _log_summary_error(input_text_id: str, task: asyncio.Task[ServiceResponse]) -> None:
+    """Log a failed write of a task summary to its input_text helper."""
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.warning("Error storing task summary in %s: %s", input_text_id, err)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -115,13 +147,21 @@ class GoogleTaskTodoListEntity(
         self._attr_name = name.capitalize()
         self._attr_unique_id = f"{config_entry_id}-{task_list_id}"
         self._task_list_id = task_list_id
+        self._pending_refresh: asyncio.Task[None] | None = None
+        self._refresh_again = False
+        self._cached_items_source: list[dict[str, Any]] | None = None
+        self._cached_items: list[TodoItem] | None = None
 
     @property
     def todo_items(self) -> list[TodoItem] | None:
         """Get the current set of To-do items."""
-        if self.coordinator.data is None:
+        if (data := self.coordinator.data) is None:
             return None
-        return [_convert_api_item(item) for item in _order_tasks(self.coordinator.data)]
+        # Coordinator updates replace the list, so identity marks a new snapshot
+        if data is not self._cached_items_source:
+            self._cached_items = [_convert_api_item(item) for item in data]
+            self._cached_items_source = data
+        return self._cached_items
 
     async def async_create_todo_item(self, item: TodoItem) -> None:
         """Add an item to the To-do list."""
@@ -129,7 +169,7 @@ class GoogleTaskTodoListEntity(
             self._task_list_id,
             task=_convert_todo_item(item),
         )
-        await self.coordinator.async_refresh()
+        await self._coalesced_refresh()
 
     async def async_update_todo_item(self, item: TodoItem) -> None:
         """Update a To-do item."""
@@ -139,118 +179,136 @@ class GoogleTaskTodoListEntity(
             uid,
             task=_convert_todo_item(item),
         )
-        await self.coordinator.async_refresh()
-        await self._store_tasks_for_email(self.coordinator.data)
+        await self._coalesced_refresh()
+        # Summaries include subtasks, which coordinator.data filters out
+        self._async_refresh_email_summaries(list(self.coordinator.data_by_id.values()))
 
     async def async_delete_todo_items(self, uids: list[str]) -> None:
         """Delete To-do items."""
         await self.coordinator.api.delete(self._task_list_id, uids)
-        await self.coordinator.async_refresh()
+        await self._coalesced_refresh()
 
     async def async_move_todo_item(
         self, uid: str, previous_uid: str | None = None
     ) -> None:
         """Re-order a To-do item."""
         await self.coordinator.api.move(self._task_list_id, uid, previous=previous_uid)
-        await self.coordinator.async_refresh()
-
-    # Helper function to store tasks due today
-    async def _store_tasks_for_email(self, tasks: list[TodoItem]) -> None:
-        """Store tasks in an input_text helper for later email."""
-        categorized_tasks = self.categorize_tasks(tasks)
-        task_summaries_today = "This is the list of tasks due today:\n"
-        task_summaries_today += "\n".join(
-            [f"- {task['title']}" for task in categorized_tasks["Today"]]
-        )
-        task_summaries_thisweek = "This is the list of tasks due this week:\n"
-        task_summaries_thisweek += "\n".join(
-            [f"- {task['title']}" for task in categorized_tasks["This Week"]]
-        )
-        task_summaries_upcoming = (
-            "This is the list of upcoming tasks in future weeks:\n"
-        )
-        task_summaries_upcoming += "\n".join(
-            [f"- {task['title']}" for task in categorized_tasks["Upcoming"]]
-        )
+        await self._coalesced_refresh()
 
-        task_summaries_overdue = (
-            "This is the list of overdue tasks which need your action:\n"
-        )
-        task_summaries_overdue += "\n".join(
-            [f"- {task['title']}" for task in categorized_tasks["Overdue"]]
-        )
+    async def _coalesced_refresh(self) -> None:
+        """Refresh the coordinator, sharing one refresh between concurrent callers.
 
-        # Store the task summaries as text in the input_text helpers
-        if len(categorized_tasks["Today"]) > 0:
-            await self._write_task_summaries(
-                task_summaries_today, "input_text.stored_task_data"
-            )
-        if len(categorized_tasks["This Week"]) > 0:
-            await self._write_task_summaries(
-                task_summaries_thisweek, "input_text.stored_weekly_task_data"
-            )
-        if len(categorized_tasks["Upcoming"]) > 0:
-            await self._write_task_summaries(
-                task_summaries_upcoming, "input_text.stored_upcoming_task_data"
-            )
-        if len(categorized_tasks["Overdue"]) > 0:
-            await self._write_task_summaries(
-                task_summaries_overdue, "input_text.stored_overdue_task_data"
+        A caller arriving while a refresh is pending waits for it and asks for
+        one more pass, so it still observes data fetched after its mutation.
+        """
+        if self._pending_refresh is None or self._pending_refresh.done():
+            self._pending_refresh = self.hass.async_create_task(
+                self._async_refresh_loop(), f"{self.entity_id} refresh"
             )
+        else:
+            self._refresh_again = True
+        # Cancelling one caller must not cancel the refresh others wait on
+        await asyncio.shield(self._pending_refresh)
 
-    async def _write_task_summaries(self, text_value: str, input_text_id: str):
-        await self.hass.services.async_call(
-            "input_text",
-            "set_value",
-            {
-                "entity_id": input_text_id,
-                "value": text_value,
-            },
-        )
+    async def _async_refresh_loop(self) -> None:
+        """Refresh the coordinator until no further refresh was requested."""
+        try:
+            self._refresh_again = True
+            while self._refresh_again:
+                self._refresh_again = False
+                await self.coordinator.async_refresh()
+        finally:
+            self._pending_refresh = None
+
+    @callback
+    def _async_refresh_email_summaries(
+        self, raw_tasks: list[dict[str, Any]] | None
+    ) -> None:
+        """Store task summaries in input_text helpers for later email.
+
+        Summaries are built from the raw API task dicts, never from todo_items.
+        """
+        if not raw_tasks:
+            return
+        categorized_tasks = _categorize_tasks(raw_tasks)
+        pairs = [
+            (
+                input_text_id,
+                f"{header}- "
+                + "\n- ".join(task["title"] for task in categorized_tasks[category]),
+            )
+            for category, header, input_text_id in EMAIL_SUMMARIES
+            if categorized_tasks[category]
+        ]
+        for input_text_id, text_value in pairs:
+            # Skip helpers that already hold this summary
+            if (
+                state := self.hass.states.get(input_text_id)
+            ) is not None and state.state == text_value:
+                continue
+            self.hass.async_create_task(
+                self.hass.services.async_call(
+                    "input_text",
+                    "set_value",
+                    {
+                        "entity_id": input_text_id,
+                        "value": text_value,
+                    },
+                    # Wait inside the task so failures reach the done callback
+                    blocking=True,
+                ),
+                f"{self.entity_id} store {input_text_id}",
+            ).add_done_callback(partial(_log_summary_error, input_text_id))
 
-    # Categorize tasks by due date as "Today","This Week" and "Upcoming" and return the task list categorized
     def categorize_tasks(
         self, tasks: list[dict[str, Any]]
     ) -> dict[str, list[dict[str, Any]]]:
         """Categorize tasks by due date."""
-        current_date = date.today()
-        # get the start and end dates of the current week
-        week_start = current_date - timedelta(days=current_date.weekday())
-        week_end = week_start + timedelta(days=6)
-        # Dictionary to keep the categorized tasks
-        categorized_tasks: dict[str, list[dict[str, Any]]] = {
-            "Today": [],
-            "This Week": [],
-            "Upcoming": [],
-            "Overdue": [],
-        }
-        for task in tasks:
-            due_date = None
-            due_str = task.get("due")
-            task_status = task.get("status")
-            if due_str:
-                parsed_date = isoparse(due_str)
-                due_date = parsed_date.date()
-            if due_date:
-                if due_date == current_date:
-                    categorized_tasks["Today"].append(task)
-                elif week_start <= due_date and due_date <= week_end:
-                    categorized_tasks["This Week"].append(task)
-                elif due_date > week_end:
-                    categorized_tasks["Upcoming"].append(task)
-                elif due_date < week_start and task_status == "needsAction":
-                    categorized_tasks["Overdue"].append(task)
-        return categorized_tasks
-
-
-def _order_tasks(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Order the task items response.
-
-    All tasks have an order amongst their sibblings based on position.
-
-        Home Assistant To-do items do not support the Google Task parent/sibbling
-    relationships and the desired behavior is for them to be filtered.
-    """
-    parents = [task for task in tasks if task.get("parent") is None]
-    parents.sort(key=lambda task: task["position"])
-    return parents
+        return _categorize_tasks(tasks)
+
+
+@lru_cache(maxsize=1)
+def _week_bounds(today: date) -> tuple[int, int, int]:
+    """Return the ordinals of today and the start and end of its week."""
+    today_ord = today.toordinal()
+    week_start_ord = today_ord - today.weekday()
+    return today_ord, week_start_ord, week_start_ord + 6
+
+
+def _categorize_tasks(
+    tasks: list[dict[str, Any]], today: date | None = None
+) -> dict[str, list[dict[str, Any]]]:
+    """Categorize tasks by due date relative to today."""
+    if not tasks:
+        return {"Today": [], "This Week": [], "Upcoming": [], "Overdue": []}
+    today_ord, week_start_ord, week_end_ord = _week_bounds(today or date.today())
+    today_tasks: list[dict[str, Any]] = []
+    week_tasks: list[dict[str, Any]] = []
+    upcoming_tasks: list[dict[str, Any]] = []
+    overdue_tasks: list[dict[str, Any]] = []
+    for task in tasks:
+        due_date = task.get("_due_date")
+        if due_date is None:
+            if not (due_str := task.get("due")):
+                continue
+            due_date = date.fromisoformat(due_str[:10])
+        due_ord = due_date.toordinal()
+        bucket = (
+            today_tasks
+            if due_ord == today_ord
+            else week_tasks
+            if week_start_ord <= due_ord <= week_end_ord
+            else upcoming_tasks
+            if due_ord > week_end_ord
+            else overdue_tasks
+            if task.get("status") == "needsAction"
+            else None
+        )
+        if bucket is not None:
+            bucket.append(task)
+    return {
+        "Today": today_tasks,
+        "This Week": week_tasks,
+        "Upcoming": upcoming_tasks,
+        "Overdue": overdue_tasks,
+    }
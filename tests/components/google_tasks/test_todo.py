@@ -1,17 +1,22 @@
 """Tests for Google Tasks todo platform."""
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import date, timedelta
 from http import HTTPStatus
 import json
 from typing import Any
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 from httplib2 import Response
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from homeassistant.components.google_tasks.todo import GoogleTaskTodoListEntity
+from homeassistant.components.google_tasks.todo import (
+    GoogleTaskTodoListEntity,
+    _categorize_tasks,
+)
 from homeassistant.components.todo import (
     ATTR_DESCRIPTION,
     ATTR_DUE_DATE,
@@ -19,12 +24,14 @@ from homeassistant.components.todo import (
     ATTR_RENAME,
     ATTR_STATUS,
     DOMAIN as TODO_DOMAIN,
+    TodoItem,
     TodoServices,
 )
 from homeassistant.const import ATTR_ENTITY_ID, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 
+from tests.common import async_mock_service
 from tests.typing import WebSocketGenerator
 
 ENTITY_ID = "todo.my_tasks"
@@ -108,6 +115,25 @@ LIST_TASKS_RESPONSE_REORDER = {
     ],
 }
 
+LIST_TASKS_RESPONSE_SUBTASK_DUE = {
+    "items": [
+        {
+            "id": "some-task-id",
+            "title": "Water",
+            "status": "needsAction",
+            "position": "00000000000000000001",
+        },
+        {
+            "id": "some-subtask-id",
+            "title": "Filter",
+            "status": "needsAction",
+            "parent": "some-task-id",
+            "position": "00000000000000000001",
+            "due": "2024-10-16T00:00:00.000Z",
+        },
+    ],
+}
+
 # API responses when testing update methods
 UPDATE_API_RESPONSES = [
     LIST_TASK_LIST_RESPONSE,
@@ -115,6 +141,12 @@ UPDATE_API_RESPONSES = [
     EMPTY_RESPONSE,  # update
     LIST_TASKS_RESPONSE,  # refresh after update
 ]
+SUMMARY_API_RESPONSES = [
+    LIST_TASK_LIST_RESPONSE,
+    LIST_TASKS_RESPONSE_SUBTASK_DUE,
+    EMPTY_RESPONSE,  # update
+    LIST_TASKS_RESPONSE_SUBTASK_DUE,  # refresh after update
+]
 CREATE_API_RESPONSES = [
     LIST_TASK_LIST_RESPONSE,
     LIST_TASKS_RESPONSE,
@@ -253,6 +285,40 @@ def test_categorize_tasks_mixed(google_task_entity):
     assert categorized_tasks["Upcoming"][1]["title"] == "Task 3"
 
 
+def test_categorize_tasks_fixed_date() -> None:
+    """Test categorizing tasks relative to a fixed date."""
+    today = date(2024, 10, 16)  # Wednesday
+    mock_tasks = [
+        {"title": "Today", "due": "2024-10-16T00:00:00.000Z"},
+        {"title": "Monday", "due": "2024-10-14T00:00:00.000Z"},
+        {"title": "Sunday", "due": "2024-10-20T00:00:00.000Z"},
+        {"title": "Next week", "due": "2024-10-21T00:00:00.000Z"},
+        {
+            "title": "Overdue",
+            "due": "2024-10-13T00:00:00.000Z",
+            "status": "needsAction",
+        },
+        {
+            "title": "Completed",
+            "due": "2024-10-13T00:00:00.000Z",
+            "status": "completed",
+        },
+        {"title": "No due date"},
+    ]
+
+    categorized_tasks = _categorize_tasks(mock_tasks, today)
+
+    assert {
+        category: [task["title"] for task in tasks]
+        for category, tasks in categorized_tasks.items()
+    } == {
+        "Today": ["Today"],
+        "This Week": ["Monday", "Sunday"],
+        "Upcoming": ["Next week"],
+        "Overdue": ["Overdue"],
+    }
+
+
 @pytest.fixture(name="api_responses")
 def mock_api_responses() -> list[dict | list]:
     """Fixture for API responses to return during test."""
@@ -623,6 +689,106 @@ async def test_update_todo_list_item_error(
         )
 
 
+@pytest.mark.parametrize("api_responses", [SUMMARY_API_RESPONSES])
+async def test_update_stores_subtask_summary(
+    hass: HomeAssistant,
+    setup_credentials: None,
+    integration_setup: Callable[[], Awaitable[bool]],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the stored task summaries include subtasks."""
+    freezer.move_to("2024-10-16 12:00:00")
+    set_value_calls = async_mock_service(hass, "input_text", "set_value")
+
+    assert await integration_setup()
+
+    await hass.services.async_call(
+        TODO_DOMAIN,
+        TodoServices.UPDATE_ITEM,
+        {ATTR_ITEM: "some-task-id", ATTR_RENAME: "Soda"},
+        target={ATTR_ENTITY_ID: "todo.my_tasks"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert [call.data for call in set_value_calls] == [
+        {
+            "entity_id": "input_text.stored_task_data",
+            "value": "This is the list of tasks due today:\n- Filter",
+        }
+    ]
+
+
+@pytest.mark.parametrize("api_responses", [SUMMARY_API_RESPONSES])
+@pytest.mark.parametrize(
+    ("helper_state", "expected_calls"),
+    [
+        ("This is the list of tasks due today:\n- Filter", 0),
+        ("This is the list of tasks due today:\n- Water", 1),
+        ("", 1),
+    ],
+    ids=("unchanged", "changed", "cleared"),
+)
+async def test_update_skips_unchanged_summary(
+    hass: HomeAssistant,
+    setup_credentials: None,
+    integration_setup: Callable[[], Awaitable[bool]],
+    freezer: FrozenDateTimeFactory,
+    helper_state: str,
+    expected_calls: int,
+) -> None:
+    """Test a summary is only written when the helper holds a different value."""
+    freezer.move_to("2024-10-16 12:00:00")
+    set_value_calls = async_mock_service(hass, "input_text", "set_value")
+    hass.states.async_set("input_text.stored_task_data", helper_state)
+
+    assert await integration_setup()
+
+    await hass.services.async_call(
+        TODO_DOMAIN,
+        TodoServices.UPDATE_ITEM,
+        {ATTR_ITEM: "some-task-id", ATTR_RENAME: "Soda"},
+        target={ATTR_ENTITY_ID: "todo.my_tasks"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert len(set_value_calls) == expected_calls
+
+
+@pytest.mark.parametrize("api_responses", [SUMMARY_API_RESPONSES])
+async def test_update_summary_write_error(
+    hass: HomeAssistant,
+    setup_credentials: None,
+    integration_setup: Callable[[], Awaitable[bool]],
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failed summary write is logged without failing the update."""
+    freezer.move_to("2024-10-16 12:00:00")
+
+    async def set_value(call: ServiceCall) -> None:
+        raise HomeAssistantError("Helper unavailable")
+
+    hass.services.async_register("input_text", "set_value", set_value)
+
+    assert await integration_setup()
+
+    await hass.services.async_call(
+        TODO_DOMAIN,
+        TodoServices.UPDATE_ITEM,
+        {ATTR_ITEM: "some-task-id", ATTR_RENAME: "Soda"},
+        target={ATTR_ENTITY_ID: "todo.my_tasks"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert (
+        "Error storing task summary in input_text.stored_task_data: "
+        "Helper unavailable"
+    ) in caplog.text
+
+
 @pytest.mark.parametrize(
     ("api_responses", "item_data"),
     [
@@ -1070,3 +1236,125 @@ async def test_susbcribe(
     assert items[0]["summary"] == "Milk"
     assert items[0]["status"] == "needs_action"
     assert "uid" in items[0]
+
+
+@pytest.fixture
+def refresh_gate() -> asyncio.Event:
+    """Fixture for an event that holds the first coordinator refresh."""
+    return asyncio.Event()
+
+
+@pytest.fixture
+def refresh_started() -> asyncio.Event:
+    """Fixture for an event set when a coordinator refresh starts."""
+    return asyncio.Event()
+
+
+@pytest.fixture
+def refresh_hooks() -> list[Callable[[], None]]:
+    """Fixture for callbacks run at the end of the next coordinator refreshes."""
+    return []
+
+
+@pytest.fixture
+def mutating_entity(
+    hass: HomeAssistant,
+    refresh_gate: asyncio.Event,
+    refresh_started: asyncio.Event,
+    refresh_hooks: list[Callable[[], None]],
+) -> GoogleTaskTodoListEntity:
+    """Fixture for an entity whose refresh reports how many mutations it saw."""
+    coordinator = Mock()
+    coordinator.data = 0
+    mutations = 0
+
+    async def insert(*args: Any, **kwargs: Any) -> None:
+        nonlocal mutations
+        mutations += 1
+
+    async def refresh() -> None:
+        seen = mutations
+        refresh_started.set()
+        await refresh_gate.wait()
+        coordinator.data = seen
+        if refresh_hooks:
+            refresh_hooks.pop(0)()
+
+    coordinator.api.insert = AsyncMock(side_effect=insert)
+    coordinator.async_refresh = AsyncMock(side_effect=refresh)
+    entity = GoogleTaskTodoListEntity(
+        coordinator=coordinator,
+        name="My tasks",
+        config_entry_id="test_config_id",
+        task_list_id="test_task_list_id",
+    )
+    entity.hass = hass
+    entity.entity_id = ENTITY_ID
+    return entity
+
+
+async def _create_item(entity: GoogleTaskTodoListEntity, summary: str) -> int:
+    """Create an item and return the mutation count the entity then observes."""
+    await entity.async_create_todo_item(TodoItem(summary=summary))
+    return entity.coordinator.data
+
+
+async def test_coalesced_refresh_burst(
+    hass: HomeAssistant,
+    mutating_entity: GoogleTaskTodoListEntity,
+    refresh_gate: asyncio.Event,
+    refresh_started: asyncio.Event,
+) -> None:
+    """Test a burst of mutations during a refresh shares one more refresh."""
+    first = hass.async_create_task(_create_item(mutating_entity, "Milk"))
+    await refresh_started.wait()
+    burst = [
+        hass.async_create_task(_create_item(mutating_entity, summary))
+        for summary in ("Water", "Cheese", "Soda")
+    ]
+    refresh_gate.set()
+
+    assert await asyncio.gather(first, *burst) == [4, 4, 4, 4]
+    assert mutating_entity.coordinator.async_refresh.await_count == 2
+
+
+async def test_coalesced_refresh_after_completion(
+    hass: HomeAssistant,
+    mutating_entity: GoogleTaskTodoListEntity,
+    refresh_gate: asyncio.Event,
+    refresh_hooks: list[Callable[[], None]],
+) -> None:
+    """Test a mutation arriving as a refresh completes gets its own refresh."""
+    second: list[asyncio.Task[int]] = []
+
+    def start_second() -> None:
+        second.append(hass.async_create_task(_create_item(mutating_entity, "Water")))
+
+    # Start the second mutation after the refresh finished but before the
+    # first caller resumes
+    refresh_hooks.append(lambda: hass.loop.call_soon(start_second))
+    first = hass.async_create_task(_create_item(mutating_entity, "Milk"))
+    refresh_gate.set()
+    await first
+
+    assert await second[0] == 2
+    assert mutating_entity.coordinator.async_refresh.await_count == 2
+
+
+async def test_coalesced_refresh_cancelled_caller(
+    hass: HomeAssistant,
+    mutating_entity: GoogleTaskTodoListEntity,
+    refresh_gate: asyncio.Event,
+    refresh_started: asyncio.Event,
+) -> None:
+    """Test cancelling one caller does not cancel the shared refresh."""
+    first = hass.async_create_task(_create_item(mutating_entity, "Milk"))
+    await refresh_started.wait()
+    second = hass.async_create_task(_create_item(mutating_entity, "Water"))
+    first.cancel()
+    refresh_gate.set()
+
+    assert await second == 2
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert mutating_entity.coordinator.async_refresh.await_count == 2
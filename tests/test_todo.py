@@ -1,7 +1,6 @@
 import pytest
 from homeassistant.components.google_tasks.todo import GoogleTaskTodoListEntity
 from datetime import date, timedelta
-from dateutil.parser import isoparse
 
 
 @pytest.fixture